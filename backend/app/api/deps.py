@@ -19,7 +19,9 @@ reusable_oauth2 = OAuth2PasswordBearer(
 
 
 def get_db() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+    # Every column value is generated client-side, so instances are already
+    # up to date after a commit and don't need to be re-read from the DB
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
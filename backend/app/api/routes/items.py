@@ -64,7 +64,6 @@ def create_item(
     item = Item.model_validate(item_in, update={"owner_id": current_user.id})
     session.add(item)
     session.commit()
-    session.refresh(item)
     return item
 
 
@@ -88,7 +87,6 @@ def update_item(
     item.sqlmodel_update(update_dict)
     session.add(item)
     session.commit()
-    session.refresh(item)
     return item
 
 
@@ -1,3 +1,6 @@
+import logging
+
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, create_engine, select, SQLModel
 
 from app import crud
@@ -7,6 +10,8 @@ from app.models import User, UserCreate, Item  # Import all models here
 # This ensures all SQLModel models are imported and registered with SQLModel
 # before creating the database tables.
 
+logger = logging.getLogger(__name__)
+
 engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
 
 
@@ -26,11 +31,11 @@ def init_db() -> None:
     # Create initial data
     with Session(engine) as session:
         # Create first superuser if it doesn't exist
-        user = session.exec(
-            select(User).where(User.email == settings.FIRST_SUPERUSER)
+        user_id = session.exec(
+            select(User.id).where(User.email == settings.FIRST_SUPERUSER).limit(1)
         ).first()
-        
-        if not user and settings.FIRST_SUPERUSER and settings.FIRST_SUPERUSER_PASSWORD:
+
+        if user_id is None and settings.FIRST_SUPERUSER and settings.FIRST_SUPERUSER_PASSWORD:
             user_in = UserCreate(
                 email=settings.FIRST_SUPERUSER,
                 password=settings.FIRST_SUPERUSER_PASSWORD,
@@ -38,6 +43,10 @@ def init_db() -> None:
                 is_active=True,
                 full_name="Initial Superuser"
             )
-            user = crud.create_user(session=session, user_create=user_in)
-            session.commit()
-            print("Created initial superuser:", user.email)
+            try:
+                user = crud.create_user(session=session, user_create=user_in)
+            except IntegrityError:
+                # Another replica created the superuser between our check and insert
+                session.rollback()
+                return
+            logger.info("Created initial superuser: %s", user.email)
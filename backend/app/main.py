@@ -1,6 +1,9 @@
 import os
+
 import sentry_sdk
+import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
@@ -9,16 +12,21 @@ from app.core.config import settings
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
-    return f"{route.tags[0]}-{route.name}"
+    tags = route.tags
+    return f"{tags[0]}-{route.name}" if tags else f"api-{route.name}"
 
 
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
-    sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
+    sentry_sdk.init(
+        dsn=str(settings.SENTRY_DSN),
+        traces_sample_rate=settings.SENTRY_TRACES_SAMPLE_RATE,
+    )
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    default_response_class=ORJSONResponse,
 )
 
 # Set all CORS enabled origins
@@ -36,3 +44,16 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 # Get host and port from environment variables
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", 8000))
+
+
+if __name__ == "__main__":
+    # Pin the C event loop and HTTP parser (both ship with uvicorn[standard])
+    # so a missing extra fails loudly instead of silently using asyncio/h11
+    uvicorn.run(
+        "app.main:app",
+        host=HOST,
+        port=PORT,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", 1)),
+    )
@@ -0,0 +1,18 @@
+from sqlmodel import Session, func, select
+
+from app import crud
+from app.models import Item, ItemCreate
+from app.tests.utils.user import create_random_user
+from app.tests.utils.utils import random_lower_string
+
+
+def test_bulk_create_items(db: Session) -> None:
+    user = create_random_user(db)
+    items_in = [ItemCreate(title=random_lower_string()) for _ in range(3)]
+    items = crud.bulk_create_items(session=db, items_in=items_in, owner_id=user.id)
+    assert [item.title for item in items] == [item.title for item in items_in]
+    assert all(item.owner_id == user.id for item in items)
+    count = db.exec(
+        select(func.count()).select_from(Item).where(Item.owner_id == user.id)
+    ).one()
+    assert count == 3